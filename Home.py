@@ -1,6 +1,9 @@
 # Home.py
 import streamlit as st
-from utils import build_rate_constants, DEFAULT_BASE_RATES
+from utils import build_rate_constants, DEFAULT_BASE_RATES, RATE_LABELS
+
+# Entry fields that count a day as "entered" in the progress bar
+_PROGRESS_KEYS = ("rs_on", "as_on", "rs_off", "as_off", "worked", "extra", "sick", "off", "ado")
 
 st.set_page_config(page_title="Timesheet Calculator", page_icon="🗓️", layout="wide")
 
@@ -22,7 +25,10 @@ st.markdown("""
 st.subheader("Set Base Rates (optional)")
 st.caption("Only three inputs are needed. All other rates are auto-derived using your existing multipliers.")
 
-base = st.session_state.get("base_rates", DEFAULT_BASE_RATES.copy())
+# (explicit `if`: a .get() default would be evaluated on every rerun; base is read-only here)
+base = st.session_state.get("base_rates")
+if base is None:
+    base = DEFAULT_BASE_RATES
 
 c1, c2, c3 = st.columns(3)
 with c1:
@@ -42,19 +48,17 @@ if st.button("Save Rates"):
     st.session_state["rate_constants"] = build_rate_constants(new_base)
     st.success("Rates saved. Calculations will use your custom rates.")
 
-# Show current effective rates (read-only)
-effective = st.session_state.get("rate_constants", build_rate_constants(base))
+# Show current effective rates (read-only); only built when nothing is saved yet
+effective = st.session_state.get("rate_constants")
+if effective is None:
+    effective = build_rate_constants(base)
+    st.session_state["rate_constants"] = effective
 with st.expander("Show derived rates (read-only)"):
-    st.json(effective)
+    st.json({RATE_LABELS[k]: v for k, v in effective._asdict().items()})
 
 # ---------- Progress snapshot (one-day-per-page entry) ----------
 entries = st.session_state.get("entries", [])
-done = 0
-if entries:
-    for r in entries:
-        if any([r.get("rs_on"), r.get("as_on"), r.get("rs_off"), r.get("as_off"),
-                r.get("worked"), r.get("extra"), r.get("sick"), r.get("off"), r.get("ado")]):
-            done += 1
+done = sum(1 for r in entries if any(r.get(k) for k in _PROGRESS_KEYS))
 st.progress(done / 14 if entries else 0, text=f"Progress: {done}/14 days entered" if entries else "Progress: 0/14")
 
 # Helpful page links
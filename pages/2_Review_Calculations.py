@@ -1,10 +1,10 @@
 # pages/2_Review_Calculations.py
 import streamlit as st
 import pandas as pd
-from datetime import datetime, timedelta, time
+from datetime import date, timedelta
 from utils import (
-    parse_time, parse_duration, calculate_row,
-    NSW_PUBLIC_HOLIDAYS, rate_constants as DEFAULT_RATES
+    parse_hhmm, parse_duration, calculate_rows,
+    is_public_holiday, default_rate_constants
 )
 
 st.title("2) Review Calculations")
@@ -17,15 +17,17 @@ if not entries or not start_date:
     st.stop()
 
 # Use custom rates if set on Home, otherwise defaults
-rates = st.session_state.get("rate_constants", DEFAULT_RATES)
+rates = st.session_state.get("rate_constants", default_rate_constants())
 
 rows = []
+calc_inputs = []
 any_ado = False
 
 for r in entries:
     weekday   = r["weekday"]
     date_str  = r["date_str"]
-    date      = datetime.strptime(date_str, "%Y-%m-%d").date()
+    row_date  = date.fromisoformat(date_str)
+    is_weekend = row_date.weekday() >= 5   # Sat / Sun
 
     values = [r["rs_on"], r["as_on"], r["rs_off"], r["as_off"], r["worked"], r["extra"], r["date_str"]]
 
@@ -44,37 +46,42 @@ for r in entries:
     elif sick or off:
         effective_values[0] = "OFF"; chosen_flag = "OFF"
 
+    # One pass over the fields for the OFF/ADO markers, shared by unit/penalty/special
+    upper_values = [v.upper() for v in effective_values]
+    has_ado = "ADO" in upper_values
+    off_day = sick or has_ado or "OFF" in upper_values
+
+    # Actual sign-on/off: minutes from midnight of this date (None if blank/invalid)
+    AS_ON  = parse_hhmm(effective_values[1])
+    AS_OFF = parse_hhmm(effective_values[3])
+
     # -------- Unit (original logic) --------
     unit = 0.0
-    if any(v.upper() in ["OFF", "ADO"] for v in effective_values) or sick:
+    if off_day:
         unit = 0.0
     else:
-        RS_ON  = parse_time(effective_values[0])
-        AS_ON  = parse_time(effective_values[1])
-        RS_OFF = parse_time(effective_values[2])
-        AS_OFF = parse_time(effective_values[3])
+        rs_start = parse_hhmm(effective_values[0])
+        as_start = AS_ON
+        rs_end   = parse_hhmm(effective_values[2])
+        as_end   = AS_OFF
         worked_f = parse_duration(effective_values[4])
         extra_f  = parse_duration(effective_values[5])
 
-        if RS_ON and RS_OFF and AS_ON and AS_OFF:
-            rs_start = datetime.combine(date, RS_ON)
-            rs_end   = datetime.combine(date, RS_OFF)
-            if RS_OFF < RS_ON:
-                rs_end += timedelta(days=1)
-
-            as_start = datetime.combine(date, AS_ON)
-            as_end   = datetime.combine(date, AS_OFF)
-            if AS_OFF < AS_ON:
-                as_end += timedelta(days=1)
+        if None not in (rs_start, as_start, rs_end, as_end):
+            # sign-off before sign-on → next day
+            if rs_end < rs_start:
+                rs_end += 1440
+            if as_end < as_start:
+                as_end += 1440
 
             built_up = 0
             if as_start < rs_start:        # lift-up
-                delta = (rs_end - as_end).total_seconds() / 3600
+                delta = (rs_end - as_end) / 60
             elif as_end > rs_end:          # lay-back
-                delta = abs((as_start - rs_start).total_seconds() / 3600)
+                delta = abs(as_start - rs_start) / 60
             elif (as_start >= rs_start and as_end <= rs_end
                   and (as_end - as_start) < (rs_end - rs_start)):  # built-up
-                delta = abs((rs_end - rs_start).total_seconds() / 3600) - 8
+                delta = abs(rs_end - rs_start) / 60 - 8
                 built_up = 1
             else:
                 delta = 0.0
@@ -88,47 +95,47 @@ for r in entries:
 
     # -------- Penalty --------
     penalty = "No"
-    AS_ON  = parse_time(effective_values[1])
-    AS_OFF = parse_time(effective_values[3])
-    if (not any(v.upper() in ["OFF","ADO"] for v in effective_values)
-        and not sick and AS_ON and AS_OFF and weekday not in ["Saturday","Sunday"]):
-        m1 = AS_ON.hour*60 + AS_ON.minute
-        m2 = AS_OFF.hour*60 + AS_OFF.minute
-        if m2 < m1: m2 += 1440
-        if 1080 <= m1 % 1440 <= 1439 or 0 <= m1 % 1440 <= 239:
+    if not off_day and AS_ON is not None and AS_OFF is not None and not is_weekend:
+        # sign-on minute (0..1439) picks the window: 18:00–03:59 Night,
+        # 04:00–05:30 Morning, otherwise Afternoon if the shift runs past 18:00
+        m1 = AS_ON
+        m2 = AS_OFF if AS_OFF >= AS_ON else AS_OFF + 1440
+        if m1 >= 1080 or m1 < 240:
             penalty = "Night"
-        elif 240 <= m1 % 1440 <= 330:
+        elif m1 <= 330:
             penalty = "Morning"
-        elif m1 <= 1080 <= m2:
+        elif m2 >= 1080:
             penalty = "Afternoon"
 
     # -------- Special --------
     special = "No"
-    if (not any(v.upper() in ["OFF","ADO"] for v in effective_values)
-        and not sick and weekday not in ["Saturday","Sunday"]):
-        if (AS_ON and time(1,1) <= AS_ON <= time(3,59)) or (AS_OFF and time(1,1) <= AS_OFF <= time(3,59)):
+    if not off_day and not is_weekend:
+        # 01:01 – 03:59
+        if (AS_ON is not None and 61 <= AS_ON <= 239) or (AS_OFF is not None and 61 <= AS_OFF <= 239):
             special = "Yes"
 
-    # -------- Rates (pass effective rates) --------
-    ot, prate, sload, srate, drate, lrate, dcount = calculate_row(
-        weekday, date, effective_values, sick, penalty, special, unit,
-        rates={**rates, "OT": ot_enabled, "WOBOD": wobod_enabled}
-    )
-
+    # -------- Rates: collected here, computed for all days at once below --------
+    calc_inputs.append((weekday, row_date, effective_values, sick, penalty, special, unit,
+                        ot_enabled, wobod_enabled))
 
-
-    if any(v.upper() == "ADO" for v in effective_values):
+    if has_ado:
         any_ado = True
 
-    is_holiday = "Yes" if date_str in NSW_PUBLIC_HOLIDAYS else "No"
+    is_holiday = "Yes" if is_public_holiday(row_date) else "No"
     display_rs_on = chosen_flag if chosen_flag else values[0]
 
     rows.append([
         weekday, date_str, display_rs_on, values[1], values[2], values[3], values[4], values[5],
         "Yes" if sick else "No", f"{unit:.2f}", penalty, special, is_holiday,
+    ])
+
+# One vectorized pass over the fortnight (pass effective rates)
+results = calculate_rows(calc_inputs, rates)
+for row, (ot, prate, sload, srate, drate, lrate, dcount) in zip(rows, results):
+    row += [
         f"{ot:.2f}", f"{sload:.2f}", f"{prate:.2f}", f"{srate:.2f}",
         f"{lrate:.2f}", f"{drate:.2f}", f"{dcount:.2f}"
-    ])
+    ]
 
 
 # Build table
@@ -144,7 +151,7 @@ totals_float = [pd.to_numeric(df[c], errors="coerce").fillna(0).sum() for c in c
 
 # Long-fortnight deduction if no ADO anywhere (use effective rates)
 if not any_ado:
-    deduction = 0.5 * rates["Ordinary Hours"] * 8  # half a day of ordinary
+    deduction = 0.5 * rates.ordinary * 8  # half a day of ordinary
     totals_float[-1] -= deduction
     st.warning(f"Applied long-fortnight deduction: -{deduction:.2f}")
 
@@ -1,6 +1,16 @@
 # utils.py
-import math
-from datetime import datetime, timedelta, time
+import functools
+from datetime import date, time
+from typing import NamedTuple
+
+import numpy as np
+
+__all__ = [
+    "DEFAULT_BASE_RATES", "Rates", "RATE_LABELS", "build_rate_constants", "default_rate_constants",
+    "NSW_PUBLIC_HOLIDAYS", "is_public_holiday",
+    "parse_hhmm", "parse_time", "parse_duration",
+    "calculate_row", "calculate_rows", "calc_fortnight",
+]
 
 # -------- Defaults (same structure as your original) --------
 DEFAULT_BASE_RATES = {
@@ -9,115 +19,202 @@ DEFAULT_BASE_RATES = {
     "night_penalty": 5.69,
 }
 
-def build_rate_constants(base: dict):
+class Rates(NamedTuple):
+    """
+    Full rate table (AUD). Immutable and hashable, so one instance can be
+    memoized and shared across reruns; use ._asdict() for display.
+    """
+    # penalties (per-hour adders)
+    afternoon: float
+    early_morning: float       # same as Afternoon in your app
+    night: float
+    special_loading: float     # same as Night in your app
+
+    # OT / loadings (multiples of ordinary)
+    ot150: float
+    ot200: float
+    ado_adjustment: float
+    sat50: float
+    sun100: float
+    public_holiday: float
+    ph50: float
+    ph100: float
+
+    # other ordinary-based
+    sick: float
+    ordinary: float
+
+# Payslip labels for the Rates fields, used when showing the table to users
+RATE_LABELS = {
+    "afternoon": "Afternoon Shift",
+    "early_morning": "Early Morning",
+    "night": "Night Shift",
+    "special_loading": "Special Loading",
+    "ot150": "OT 150%",
+    "ot200": "OT 200%",
+    "ado_adjustment": "ADO Adjustment",
+    "sat50": "Sat Loading 50%",
+    "sun100": "Sun Loading 100%",
+    "public_holiday": "Public Holiday",
+    "ph50": "PH Loading 50%",
+    "ph100": "PH Loading 100%",
+    "sick": "Sick With MC",
+    "ordinary": "Ordinary Hours",
+}
+
+def build_rate_constants(base: dict) -> Rates:
     """
     Build the full rate table from three base inputs.
     Multipliers match your existing constants.
+
+    The table is memoized on the three base values, so Streamlit reruns with
+    unchanged rates get the same Rates back.
     """
-    ordinary = base["ordinary"]
-    aft = base["afternoon_penalty"]
-    night = base["night_penalty"]
-
-    rates = {
-        # penalties (per-hour adders)
-        "Afternoon Shift": aft,
-        "Early Morning": aft,          # same as Afternoon in your app
-        "Night Shift": night,
-        "Special Loading": night,      # same as Night in your app
-
-        # OT / loadings (multiples of ordinary)
-        "OT 150%": ordinary * 1.5,
-        "OT 200%": ordinary * 2.0,
-        "ADO Adjustment": ordinary,
-        "Sat Loading 50%": ordinary * 0.5,
-        "Sun Loading 100%": ordinary * 1.0,
-        "Public Holiday": ordinary,
-        "PH Loading 50%": ordinary * 0.5,
-        "PH Loading 100%": ordinary * 1.0,
-
-        # other ordinary-based
-        "Sick With MC": ordinary,
-        "Ordinary Hours": ordinary,
-    }
+    return _build_rate_constants(
+        float(base["ordinary"]),
+        float(base["afternoon_penalty"]),
+        float(base["night_penalty"]),
+    )
+
+# Multiples of ordinary, in Rates field order:
+#   ot150, ot200, ado_adjustment, sat50, sun100, public_holiday, ph50, ph100, sick, ordinary
+_ORD_MULT = np.array([1.5, 2.0, 1.0, 0.5, 1.0, 1.0, 0.5, 1.0, 1.0, 1.0], dtype=np.float64)
+
+@functools.lru_cache(maxsize=32)
+def _build_rate_constants(ordinary: float, aft: float, night: float) -> Rates:
+    # penalties (per-hour adders): Early Morning = Afternoon and
+    # Special Loading = Night in your app
+    penalties = np.array([aft, aft, night, night], dtype=np.float64)
     # round to 5 decimals for parity with previous constants
-    return {k: round(v, 5) for k, v in rates.items()}
+    vals = np.round(np.concatenate([penalties, _ORD_MULT * ordinary]), 5)
+    return Rates._make(vals.tolist())
 
 # Keep a default set available (used if user doesn't customize)
-rate_constants = build_rate_constants(DEFAULT_BASE_RATES)
+@functools.cache
+def default_rate_constants() -> Rates:
+    return build_rate_constants(DEFAULT_BASE_RATES)
 
-NSW_PUBLIC_HOLIDAYS = {
+_NSW_PH_STRS = (
     "2025-01-01", "2025-01-27", "2025-04-18", "2025-04-19", "2025-04-20", "2025-04-21",
     "2025-04-25", "2025-06-09", "2025-10-06", "2025-12-25", "2025-12-26"
-}
+)
+# date ordinals (int hashing, no per-lookup allocation); test with is_public_holiday()
+NSW_PUBLIC_HOLIDAYS = frozenset(date.fromisoformat(s).toordinal() for s in _NSW_PH_STRS)
+
+def is_public_holiday(d: date) -> bool:
+    return d.toordinal() in NSW_PUBLIC_HOLIDAYS
 
 # -------------------- parsing helpers -------------------- #
-def parse_time(text: str):
+# parse_hhmm and parse_duration are memoized: a fortnight only has a few dozen distinct time
+# strings and Streamlit re-parses all of them on every rerun.
+def _parse_hhmm(text: str, clock: bool = True) -> int:
+    """
+    "HH:MM", "H:MM", "H:M", "HHMM" or "HMM" -> hours*60 + minutes.
+    Returns -1 for anything else. With clock=True (time of day) minutes >= 60
+    are rejected too; durations keep them, e.g. "0:90" -> 90.
+    Single pass over at most 5 characters; no strptime, no exceptions.
+    """
     text = (text or "").strip()
-    if not text:
-        return None
-    try:
-        if ":" in text:
-            return datetime.strptime(text, "%H:%M").time()
-        if text.isdigit() and len(text) in [3, 4]:
-            h, m = int(text[:-2]), int(text[-2:])
-            return time(h, m)
-    except:
+    n = len(text)
+    if n < 3 or n > 5:
+        return -1
+
+    hours = -1         # set once the ':' is seen
+    acc = 0            # digits of the current part
+    part_len = 0
+    for c in text:
+        if "0" <= c <= "9":
+            acc = acc * 10 + (ord(c) - 48)
+            part_len += 1
+        elif c == ":" and hours < 0 and 0 < part_len <= 2:
+            hours, acc, part_len = acc, 0, 0
+        else:
+            return -1
+
+    if hours >= 0:                     # H:MM / HH:MM
+        if not 0 < part_len <= 2:
+            return -1
+        minutes = acc
+    elif n <= 4:                       # HMM / HHMM
+        hours, minutes = divmod(acc, 100)
+    else:
+        return -1
+
+    return hours * 60 + minutes if minutes < 60 or not clock else -1
+
+@functools.lru_cache(maxsize=256)
+def parse_hhmm(text: str):
+    """Time of day as minutes since midnight (0..1439), or None."""
+    m = _parse_hhmm(text)
+    return m if 0 <= m < 1440 else None
+
+def parse_time(text: str):
+    # parse_hhmm is already memoized; a second cache layer would only add a lookup
+    m = parse_hhmm(text)
+    if m is None:
         return None
-    return None
+    return time(m // 60, m % 60)
 
+@functools.lru_cache(maxsize=256)
 def parse_duration(text: str) -> float:
-    text = (text or "").strip()
-    if not text:
+    m = _parse_hhmm(text, clock=False)
+    if m < 0:
         return 0
-    try:
-        if ":" in text:
-            h, m = map(int, text.split(":"))
-            return h + m / 60
-        if text.isdigit():
-            h, m = int(text[:-2]), int(text[-2:])
-            return h + m / 60
-    except:
-        return 0
-    return 0
+    return m / 60.0
 
 # -------------------- internal helpers for OT / loading split -------------------- #
-def _hours_between(a: datetime, b: datetime) -> float:
-    return (b - a).total_seconds() / 3600.0
-
-def _split_shift_by_midnight(start_dt: datetime, end_dt: datetime):
+def _split_hours(on_min: np.ndarray, off_min: np.ndarray):
     """
-    Split a shift into segments that don't cross midnight.
-    Example: 2025-11-15 19:00 -> 2025-11-16 02:33
-    becomes: [ (15th 19:00, 16th 00:00), (16th 00:00, 16th 02:33) ]
+    Hours worked on the sign-on date and on the next date, from minutes since
+    midnight (elementwise). Sign-off before sign-on means the shift crosses
+    midnight; a shift is under 24h, so it spans at most two dates.
+    Example: 19:00 -> 02:33 gives (5.0, 2.55).
     """
-    segments = []
-    cur = start_dt
-    while cur.date() < end_dt.date():
-        midnight = datetime.combine(cur.date() + timedelta(days=1), time(0, 0))
-        segments.append((cur, midnight))
-        cur = midnight
-    segments.append((cur, end_dt))
-    return segments
-
-def _ot_multiplier_for_day(day_index: int) -> float:
+    total = off_min - on_min + np.where(off_min < on_min, 1440, 0)
+    first = np.minimum(total, 1440 - on_min)
+    return first / 60.0, (total - first) / 60.0
+
+def _cents(amount):
+    """Round pay amounts to whole cents (elementwise)."""
+    return np.rint(amount * 100) / 100
+
+# OT multiplier by weekday (Monday=0 ... Sunday=6):
+# Weekday OT = 150%, Saturday = 200%, Sunday = 250%.
+_OT_MULT = np.array([1.5, 1.5, 1.5, 1.5, 1.5, 2.0, 2.5], dtype=np.float64)
+
+@functools.lru_cache(maxsize=32)
+def _weekday_rate_tables(R: Rates):
     """
-    Monday=0 ... Sunday=6
-    Weekday OT = 150%, Saturday = 200%, Sunday = 250%.
+    Per-weekday hourly amounts for one rate table, built once per Rates:
+    weekend loading (Sat 50% / Sun 100%) and OT shift pay (ordinary * OT%).
     """
-    if day_index == 5:   # Saturday
-        return 2.0
-    if day_index == 6:   # Sunday
-        return 2.5
-    return 1.5           # Weekdays
+    weekend_load = np.array([0.0, 0.0, 0.0, 0.0, 0.0, R.sat50, R.sun100])
+    ot_hourly = _OT_MULT * R.ordinary
+    # shared between calls: keep them read-only
+    weekend_load.flags.writeable = False
+    ot_hourly.flags.writeable = False
+    return weekend_load, ot_hourly
+
+# -------------------- row codes (strings -> small ints for the pay kernel) -------------------- #
+_DAY_INDEX = {
+    "Monday": 0, "Tuesday": 1, "Wednesday": 2, "Thursday": 3,
+    "Friday": 4, "Saturday": 5, "Sunday": 6,
+}
+_PENALTY_CODES = {"Afternoon": 1, "Night": 2, "Morning": 3}   # 0 = none
+_RS_CODES = {"OFF": 1, "ADO": 2}                              # 0 = normal
 
 # -------------------- main row calculation -------------------- #
-def calculate_row(day, date_obj, values, sick, penalty_value, special_value, unit_val, rates=None):
+def calculate_row(day, date_obj, values, sick, penalty_value, special_value, unit_val, *,
+                  ot_shift=False, wobod=False, rates=None):
     """
     day:       "Monday"..."Sunday"
     date_obj:  datetime.date for that row (from Review_Calculations)
     values:    [rs_on, as_on, rs_off, as_off, worked, extra, ...]
     unit_val:  your existing 'Unit' value (already computed in Review_Calculations)
-    rates:     dict of rate constants; if None, use module default
+    ot_shift:  OT tickbox → whole-day OT shift
+    wobod:     WOBOD tickbox
+    rates:     Rates table; if None, use default_rate_constants()
+               (runtime flags are never stored in it, so it can be shared)
 
     OT logic has TWO layers:
 
@@ -131,164 +228,171 @@ def calculate_row(day, date_obj, values, sick, penalty_value, special_value, uni
 
     Weekend loading (Sat 50%, Sun 100%) is also split by midnight for non-OT shifts.
     Daily Rate uses actual worked hours, not fixed 8h.
+
+    Single-row convenience wrapper around calculate_rows.
     """
-    R = rates or rate_constants
+    row = (day, date_obj, values, sick, penalty_value, special_value, unit_val,
+           ot_shift, wobod)
+    return tuple(calculate_rows([row], rates)[0].tolist())
 
-    # Flags injected from Review_Calculations via:
-    # rates={**rates, "OT": ot_enabled, "WOBOD": wobod_enabled}
-    ot_shift_flag = R.get("OT", False)        # OT tickbox → whole-day OT shift
-    wobod_flag    = R.get("WOBOD", False)     # WOBOD tickbox
+def calculate_rows(rows, rates=None) -> np.ndarray:
+    """
+    Batch version of calculate_row for the whole fortnight.
+
+    rows:   iterable of
+            (day, date_obj, values, sick, penalty_value, special_value, unit_val, ot, wobod)
+            where ot / wobod are that day's tickboxes
+    rates:  Rates table; if None, use default_rate_constants()
 
+    Returns an (n, 7) array with the calculate_row columns:
+    OT, Penalty Rate, Special Ldg, Sick Rate, Daily Rate, Loading, Daily Count.
+    """
+    R = rates or default_rate_constants()
+    encoded = [_encode_row(*row) for row in rows]
+    if not encoded:
+        return np.zeros((0, 7))
+
+    (days, worked_hours, unit_vals, sick, penalty_codes, special, rs_codes,
+     ado_bonus, ot_flag, wobod_flag, on_min, off_min) = zip(*encoded)
+
+    return calc_fortnight(
+        np.array(days, dtype=np.int8),
+        np.array(worked_hours, dtype=np.float64),
+        np.array(unit_vals, dtype=np.float64),
+        np.array(sick, dtype=bool),
+        np.array(penalty_codes, dtype=np.int8),
+        np.array(special, dtype=bool),
+        np.array(rs_codes, dtype=np.int8),
+        np.array(ado_bonus, dtype=bool),
+        np.array(ot_flag, dtype=bool),
+        np.array(wobod_flag, dtype=bool),
+        np.array(on_min, dtype=np.int16),
+        np.array(off_min, dtype=np.int16),
+        R,
+    )
+
+def _encode_row(day, date_obj, values, sick, penalty_value, special_value, unit_val, ot, wobod):
+    """
+    Resolve one row's strings/dates into the numbers and codes calc_fortnight works on.
+    Actual sign-on/off become minutes since midnight, -1 if missing.
+    """
+    # OFF/ADO day type comes from the roster sign-on field
     rs_on = (values[0] or "").upper()
 
     # Worked hours = actual hours (or 8 if blank)
     worked_hours = parse_duration(values[4]) or 8
-    ordinary = R["Ordinary Hours"]
 
-    # Pre-parse actual shift times once (used for weekend loading & OT split)
-    AS_ON  = parse_time(values[1])
-    AS_OFF = parse_time(values[3])
+    # Pre-parse actual shift times once (used for weekend loading & OT split);
+    # without a date the split can't be placed on a weekday
+    on_min  = parse_hhmm(values[1])
+    off_min = parse_hhmm(values[3])
+    if on_min is None or off_min is None or not date_obj:
+        on_min = off_min = -1
+
+    return (
+        date_obj.weekday() if date_obj else _DAY_INDEX.get(day, 0),
+        worked_hours,
+        unit_val,
+        bool(sick),
+        _PENALTY_CODES.get(penalty_value, 0),
+        special_value == "Yes",
+        _RS_CODES.get(rs_on, 0),
+        # ADO bonus (same as your original logic: +4h ordinary) - "ADO" in any field,
+        # matching the Review page's ADO check
+        any((v or "").upper() == "ADO" for v in values),
+        bool(ot),
+        bool(wobod),
+        on_min,
+        off_min,
+    )
 
-    # ---------- PENALTY (Afternoon / Night / Morning) ----------
-    penalty_hours = math.floor(worked_hours)
-    penalty_rate = 0.0
+def calc_fortnight(days, worked_hours, unit_vals, sick, penalty_codes, special, rs_codes,
+                   ado_bonus, ot_flag, wobod_flag, on_min, off_min, R):
+    """
+    Pay arithmetic for all rows at once, one NumPy pass per column.
+
+    days:           (n,) Monday=0 ... Sunday=6
+    penalty_codes:  (n,) 0=none, 1=Afternoon, 2=Night, 3=Morning
+    rs_codes:       (n,) 0=normal, 1=OFF, 2=ADO
+    on_min/off_min: (n,) actual sign-on/off, minutes since midnight; -1 if
+                    the shift times/date could not be parsed
 
-    if penalty_value == "Afternoon":
-        penalty_rate = round(penalty_hours * R["Afternoon Shift"], 2)
-    elif penalty_value == "Night":
-        penalty_rate = round(penalty_hours * R["Night Shift"], 2)
-    elif penalty_value == "Morning":
-        penalty_rate = round(penalty_hours * R["Early Morning"], 2)
+    Returns an (n, 7) array, columns as in calculate_rows.
+    """
+    ordinary = R.ordinary
+    working  = rs_codes == 0                 # not OFF / ADO
+    ot_shift = working & ot_flag             # OT tickbox → whole-day OT shift
 
-    # ---------- SPECIAL LOADING ----------
-    special_loading = round(R["Special Loading"], 2) if special_value == "Yes" else 0.0
+    # ---------- ACTUAL SHIFT, split at midnight into (sign-on date, next date) ----------
+    has_times = (on_min >= 0) & (off_min >= 0)
+    seg_hours = np.column_stack(_split_hours(on_min, off_min))
+    seg_days  = np.column_stack([days, (days + 1) % 7])
 
-    # ---------- SICK ----------
-    sick_rate = round(8 * R["Sick With MC"], 2) if sick else 0.0
+    # ---------- PENALTY (Afternoon / Night / Morning) ----------
+    penalty_hours = np.floor(worked_hours)
+    # indexed by penalty code: none / Afternoon / Night / Morning
+    penalty_per_hour = np.array([0.0, R.afternoon, R.night, R.early_morning])
+    penalty_rate = _cents(penalty_hours * penalty_per_hour[penalty_codes])
 
-    # ---------- BASE DAILY RATE (ordinary pay) ----------
-    daily_rate = 0.0
-    if rs_on not in ["OFF", "ADO"]:
-        # base pay uses actual worked hours
-        daily_rate = round(worked_hours * ordinary, 2)
+    # ---------- SPECIAL LOADING / SICK ----------
+    special_loading = np.where(special, _cents(R.special_loading), 0.0)
+    sick_rate       = np.where(sick, _cents(8 * R.sick), 0.0)
 
-    # ADO bonus (same as your original logic: +4h ordinary)
-    if any((v or "").upper() == "ADO" for v in values):
-        daily_rate += round(4 * ordinary, 2)
+    # ---------- BASE DAILY RATE (ordinary pay, actual worked hours) + ADO bonus (+4h) ----------
+    daily_rate = np.where(working & ~ot_shift, _cents(worked_hours * ordinary), 0.0)
+    daily_rate = daily_rate + np.where(ado_bonus & ~ot_shift, _cents(4 * ordinary), 0.0)
 
     # ---------- WEEKEND LOADING (Sat 50% / Sun 100%), split over midnight if needed ----------
-    loading = 0.0
-    if rs_on not in ["OFF", "ADO"] and not ot_shift_flag:
-        if AS_ON and AS_OFF and date_obj:
-            start_dt = datetime.combine(date_obj, AS_ON)
-            end_dt   = datetime.combine(date_obj, AS_OFF)
-            if AS_OFF < AS_ON:
-                end_dt += timedelta(days=1)
-
-            segments = _split_shift_by_midnight(start_dt, end_dt)
-            total_load = 0.0
-            for s, e in segments:
-                h = _hours_between(s, e)
-                h = round(h, 2)
-                dow = s.weekday()  # 0=Mon ... 5=Sat, 6=Sun
-                if dow == 5:      # Saturday
-                    rate = R["Sat Loading 50%"]
-                elif dow == 6:    # Sunday
-                    rate = R["Sun Loading 100%"]
-                else:
-                    rate = 0.0
-                total_load += h * rate
-            loading = round(total_load, 2)
-        else:
-            # Fallback if we can't parse times/date: old behaviour
-            if day == "Saturday":
-                loading = round(worked_hours * R["Sat Loading 50%"], 2)
-            elif day == "Sunday":
-                loading = round(worked_hours * R["Sun Loading 100%"], 2)
+    weekend_load, ot_hourly = _weekday_rate_tables(R)
+    # segment hours are quantized to hundredths before loading is applied (as before)
+    split_load = (np.round(seg_hours, 2) * weekend_load[seg_days]).sum(axis=1)
+    # Fallback if we can't parse times/date: old behaviour
+    day_load = worked_hours * weekend_load[days]
+    loading = _cents(np.where(working & ~ot_flag, np.where(has_times, split_load, day_load), 0.0))
 
     # ============================================================
-    # 1) DAILY OT (original unit-based logic, now ignoring negative unit)
+    # 1) DAILY OT (original unit-based logic, ignoring unit <= 0)
     # ============================================================
-    ot_daily_pay = 0.0
-
-    if not ot_shift_flag:
-        if unit_val <= 0:
-            # Shortfall or exactly 0: no OT entry at all.
-            # Deduction is already reflected via daily_rate (worked_hours < 8).
-            ot_daily_pay = 0.0
-
-        elif rs_on == "ADO":
-            # ADO day with positive unit (if that ever occurs)
-            ot_daily_pay = round(unit_val * R["ADO Adjustment"], 2)
-
-        elif rs_on not in ["OFF", "ADO"]:
-            # Regular daily OT: weekday 150%, Sat/Sun 200%
-            if day in ["Saturday", "Sunday"]:
-                ot_daily_pay = round(unit_val * R["OT 200%"], 2)
-            else:
-                ot_daily_pay = round(unit_val * R["OT 150%"], 2)
-
-        else:
-            # OFF/ADO with positive unit: fallback to ordinary + applicable loading
-            if day == "Saturday":
-                ot_daily_pay = round(unit_val * (R["Sat Loading 50%"] + ordinary), 2)
-            elif day == "Sunday":
-                ot_daily_pay = round(unit_val * (R["Sun Loading 100%"] + ordinary), 2)
-            else:
-                if penalty_value in ["Afternoon", "Morning"]:
-                    ot_daily_pay = round(unit_val * (R["Afternoon Shift"] + ordinary), 2)
-                elif penalty_value == "Night":
-                    ot_daily_pay = round(unit_val * (R["Night Shift"] + ordinary), 2)
-                else:
-                    ot_daily_pay = round(unit_val * ordinary, 2)
+    # ADO → ADO adjustment; regular → weekday 150%, Sat/Sun 200%;
+    # OFF → ordinary + applicable loading
+    ot_daily_rate = np.select(
+        [
+            rs_codes == 2,
+            working & (days >= 5),
+            working,
+            days == 5,
+            days == 6,
+            (penalty_codes == 1) | (penalty_codes == 3),
+            penalty_codes == 2,
+        ],
+        [
+            R.ado_adjustment,
+            R.ot200,
+            R.ot150,
+            R.sat50 + ordinary,
+            R.sun100 + ordinary,
+            R.afternoon + ordinary,
+            R.night + ordinary,
+        ],
+        ordinary,
+    )
+    ot_daily_pay = _cents(np.where(~ot_flag & (unit_vals > 0), unit_vals * ot_daily_rate, 0.0))
 
     # ============================================================
-    # 2) OT SHIFT PAY (tickbox: whole day at OT rate, split by date_obj)
+    # 2) OT SHIFT PAY (tickbox: whole day at OT rate, split by date)
     # ============================================================
-    ot_shift_pay = 0.0
-
-    if ot_shift_flag and rs_on not in ["OFF", "ADO"]:
-        start_dt = end_dt = None
-
-        if AS_ON and AS_OFF and date_obj:
-            start_dt = datetime.combine(date_obj, AS_ON)
-            end_dt   = datetime.combine(date_obj, AS_OFF)
-            if AS_OFF < AS_ON:
-                # crosses midnight → add 1 day
-                end_dt += timedelta(days=1)
-
-        if start_dt and end_dt:
-            # Split at midnight, apply correct day-based OT% to each segment
-            segments = _split_shift_by_midnight(start_dt, end_dt)
-            total_ot = 0.0
-            for s, e in segments:
-                h = _hours_between(s, e)
-                mult = _ot_multiplier_for_day(s.weekday())
-                total_ot += h * ordinary * mult
-            ot_shift_pay = round(total_ot, 2)
-        else:
-            # Fallback: treat entire worked_hours as being on 'day'
-            if day == "Sunday":
-                mult = 2.5
-            elif day == "Saturday":
-                mult = 2.0
-            else:
-                mult = 1.5
-            ot_shift_pay = round(worked_hours * ordinary * mult, 2)
-
-        # In OT-shift mode we suppress normal ordinary+weekend loading for these hours
-        daily_rate = 0.0
-        loading    = 0.0
+    split_ot = (seg_hours * ot_hourly[seg_days]).sum(axis=1)
+    # Fallback: treat entire worked_hours as being on 'day'
+    day_ot = worked_hours * ot_hourly[days]
+    ot_shift_pay = _cents(np.where(ot_shift, np.where(has_times, split_ot, day_ot), 0.0))
 
     # ============================================================
     # 3) WOBOD — extra 50% ordinary * worked_hours on OT shift
     # ============================================================
-    wobod_extra = 0.0
-    if wobod_flag and ot_shift_flag and rs_on not in ["OFF", "ADO"]:
-        wobod_extra = round(worked_hours * ordinary * 0.5, 2)
+    wobod_extra = _cents(np.where(wobod_flag & ot_shift, worked_hours * ordinary * 0.5, 0.0))
 
     # ============================================================
-    # TOTALS
+    # TOTALS (sums of the cent-rounded amounts, so each row adds up)
     # ============================================================
     # OT column shows ALL OT-related money (daily OT + OT shift + WOBOD)
     ot_total_for_column = ot_daily_pay + ot_shift_pay + wobod_extra
@@ -304,4 +408,7 @@ def calculate_row(day, date_obj, values, sick, penalty_value, special_value, uni
         loading
     )
 
-    return ot_total_for_column, penalty_rate, special_loading, sick_rate, daily_rate, loading, daily_count
+    return np.column_stack([
+        ot_total_for_column, penalty_rate, special_loading, sick_rate,
+        daily_rate, loading, daily_count,
+    ])